@@ -11,13 +11,13 @@ WHERE NOT EXISTS (SELECT FROM pg_database WHERE datname = 'company_ticker_db');
 -- Create any initial extensions if needed
 CREATE EXTENSION IF NOT EXISTS "uuid-ossp";
 
--- The application will automatically create tables using pandas.to_sql()
+-- The application will automatically create its tables on first save
 -- Tables that will be created by the application:
--- - tickers: Contains ticker symbols and company names
+-- - tickers: Contains ticker symbols and company names (unique index on ticker,
+--   used by the upsert in TickerUpsertService)
 -- - metadata: Contains system metadata and update timestamps
 
 -- Optional: Create indexes for better performance (uncomment if needed)
--- CREATE INDEX CONCURRENTLY IF NOT EXISTS idx_tickers_ticker ON tickers(ticker);
 -- CREATE INDEX CONCURRENTLY IF NOT EXISTS idx_tickers_title ON tickers(title);
 
 -- Log completion
@@ -31,6 +31,7 @@ from src.models.api import (
     LatestTickersResponse,
     TimezonesResponse,
     HealthCheckResponse,
+    TopMatch,
 )
 from src.core.services.company_matcher_service import CompanyMatcherService
 from src.core.services.ticker_updater_service import TickerUpdaterService
@@ -156,14 +157,16 @@ async def match_company_form(name: str = Form(...)):
                                 score, match.get("name_match_score"), match.get("score"))
                     
                     top_matches.append(
-                        {
-                            "company_name": match.get("company_name", ""),
-                            "ticker": match.get("ticker", ""),
-                            "score": round(score, 1) if isinstance(score, (int, float)) else 0,
-                        }
+                        TopMatch.model_construct(
+                            company_name=match.get("company_name", ""),
+                            ticker=match.get("ticker", ""),
+                            score=round(score, 1) if isinstance(score, (int, float)) else 0,
+                        )
                     )
 
-        return CompanyMatchResponse(
+        # Built from trusted matcher output, so skip constructor validation
+        # (FastAPI still checks the response against response_model)
+        return CompanyMatchResponse.model_construct(
             input_name=name,
             matched_name=result.matched_name,
             predicted_ticker=result.predicted_ticker,
@@ -192,20 +195,14 @@ async def update_tickers():
     Fetch and save latest ticker data from Alpha Vantage API.
     """
     try:
-        # Fetch ticker data using the service
-        tickers_df = await ticker_updater.fetch_ticker_dataframe()
+        # Fetch ticker data and save it (also stamps last_updated metadata)
+        tickers_df = await ticker_updater.fetch_and_persist(dataframe_saver)
 
         if tickers_df.empty:
             raise HTTPException(
                 status_code=503, detail="Failed to fetch ticker data from API"
             )
 
-        # Save to database
-        dataframe_saver.save_tickers_dataframe(tickers_df)
-
-        # Update metadata
-        metadata_service.update_last_updated()
-
         return UpdateTickersResponse(
             status="success",
             message=f"Successfully updated {len(tickers_df)} tickers",
@@ -22,10 +22,19 @@ class Settings:
 
     # Matching Configuration
     FUZZY_MATCH_THRESHOLD: int = 90
+    FUZZY_MATCH_WORKERS: int = -1
     ML_NEIGHBORS_COUNT: int = 5
     OPENAI_MODEL: str = "gpt-4o-mini"
     OPENAI_MAX_TOKENS: int = 20
     OPENAI_TEMPERATURE: float = 0
+    OPENAI_BATCH_SIZE: int = 20
+    BATCH_MATCH_MAX_WORKERS: int = 10
+
+    # Database Configuration
+    DB_FETCH_BATCH_SIZE: int = 10_000
+    DB_WRITE_CHUNK_SIZE: int = 10_000
+    TICKER_CACHE_TTL_SECONDS: int = 300
+    HEALTH_CHECK_CACHE_TTL_SECONDS: float = 3.0
 
     # ETF Filtering Keywords
     ETF_KEYWORDS: list = [
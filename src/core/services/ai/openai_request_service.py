@@ -1,7 +1,8 @@
 """Service for making OpenAI API requests."""
 
+import json
 import logging
-from typing import List, Dict
+from typing import List, Dict, Tuple
 from openai import OpenAI
 from src.config.settings import settings
 from src.docs.prompts.openai_prompts import OpenAIPrompts
@@ -51,3 +52,49 @@ class OpenAIRequestService:
         logging.info("[OpenAI Fallback] OpenAI returned: %s", answer)
 
         return answer
+
+    def make_batch_matching_request(
+        self, items: List[Tuple[str, List[Dict]]]
+    ) -> List[str]:
+        """
+        Make a single request to OpenAI for matching several company names.
+
+        Args:
+            items: List of (company_name, candidates) pairs
+
+        Returns:
+            One OpenAI answer string per item, in input order
+
+        Raises:
+            ValueError: If the response is not a JSON array with one answer per item
+        """
+        prompt = OpenAIPrompts.get_batch_company_matching_prompt(items)
+
+        logging.info(
+            "[OpenAI Fallback] Batch of %d names: %s",
+            len(items),
+            [company_name for company_name, _ in items],
+        )
+
+        response = self.client.chat.completions.create(
+            model=settings.OPENAI_MODEL,
+            messages=[{"role": "user", "content": prompt}],
+            max_tokens=(settings.OPENAI_MAX_TOKENS + 5) * len(items),
+            temperature=settings.OPENAI_TEMPERATURE,
+        )
+
+        content = response.choices[0].message.content.strip()
+        logging.info("[OpenAI Fallback] OpenAI returned: %s", content)
+
+        # Tolerate the array being wrapped in a markdown code fence
+        if content.startswith("```"):
+            content = content.strip("`")
+            content = content[content.find("[") :]
+
+        answers = json.loads(content)
+        if not isinstance(answers, list) or len(answers) != len(items):
+            raise ValueError(
+                f"Expected a JSON array of {len(items)} answers from OpenAI"
+            )
+
+        return ["None" if answer is None else str(answer).strip() for answer in answers]
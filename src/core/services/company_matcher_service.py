@@ -1,6 +1,7 @@
 """Service for orchestrating company name matching using micro-services."""
 
 import logging
+import threading
 import time
 import pandas as pd
 from typing import Optional
@@ -54,6 +55,13 @@ class CompanyMatcherService:
             )
         )
 
+        # Preprocessed ticker frame reused across requests, so the matchers'
+        # per-frame indexes survive until the loader's data changes
+        self._prepared_df: Optional[pd.DataFrame] = None
+        self._prepared_version: Optional[int] = None
+        self._prepared_at = 0.0
+        self._prepared_lock = threading.Lock()
+
     def match_company(self, company_name: str) -> MatchResult:
         """
         Main entry point for company name matching using micro-services.
@@ -64,10 +72,10 @@ class CompanyMatcherService:
         Returns:
             MatchResult object with match details
         """
-        start_time = time.time()
+        start_ns = time.perf_counter_ns()
 
-        # Load ticker data using micro-service
-        tickers_df = self._load_ticker_data()
+        # Load preprocessed ticker data using micro-services
+        tickers_df = self._get_prepared_ticker_data()
 
         if tickers_df.empty:
             return MatchResult(
@@ -77,18 +85,15 @@ class CompanyMatcherService:
                 name_match_score=0,
                 message="No ticker data available",
                 top_matches=[],
-                api_latency=time.time() - start_time,
+                api_latency=(time.perf_counter_ns() - start_ns) / 1e9,
             )
 
-        # Prepare data for matching using micro-service
-        tickers_df = self.data_preparer.add_preprocessed_column(tickers_df)
-
         # Perform matching using orchestrated strategy micro-service (vectorization is automatic)
         result = self.strategy_orchestrator.orchestrate_matching_strategy(
             company_name, tickers_df
         )
 
-        api_latency = time.time() - start_time
+        api_latency = (time.perf_counter_ns() - start_ns) / 1e9
 
         return MatchResult(
             matched_name=result[0],
@@ -100,6 +105,49 @@ class CompanyMatcherService:
             api_latency=api_latency,
         )
 
+    def _get_prepared_ticker_data(self) -> pd.DataFrame:
+        """
+        Get preprocessed ticker data, reusing the last frame while it is fresh.
+
+        The frame is reloaded once the loader's cache TTL has passed or the
+        cache version changes (i.e. tickers were saved), so every request in
+        between matches against the same DataFrame object.
+
+        Returns:
+            DataFrame with ticker data and the preprocessed_title column
+        """
+        # Loaders without a ticker cache (e.g. test doubles) reload every time
+        ticker_cache = None
+        version = None
+        loader = self.dataframe_loader
+        if loader is not None:
+            ticker_cache = getattr(loader, "ticker_cache", None)
+            if ticker_cache is not None:
+                version = ticker_cache.get_version(loader.database_url)
+
+        with self._prepared_lock:
+            if (
+                self._prepared_df is not None
+                and ticker_cache is not None
+                and version == self._prepared_version
+                and time.monotonic() - self._prepared_at < ticker_cache.ttl_seconds
+            ):
+                return self._prepared_df
+
+        tickers_df = self._load_ticker_data()
+        if tickers_df.empty:
+            return tickers_df
+
+        # Prepare data for matching using micro-service
+        tickers_df = self.data_preparer.add_preprocessed_column(tickers_df)
+
+        with self._prepared_lock:
+            self._prepared_df = tickers_df
+            self._prepared_version = version
+            self._prepared_at = time.monotonic()
+
+        return tickers_df
+
     def _load_ticker_data(self) -> pd.DataFrame:
         """
         Load ticker data using micro-service.
@@ -1,5 +1,6 @@
 """Service for fetching ticker data as objects."""
 
+import asyncio
 import pandas as pd
 from typing import List
 from src.models.ticker import TickerData
@@ -36,8 +37,8 @@ class TickerDataFetcherService:
         Returns:
             List of TickerData objects
         """
-        # Fetch raw data
-        raw_df = self.data_fetcher.fetch_listing_data()
+        # Fetch raw data in a worker thread; the HTTP call is blocking
+        raw_df = await asyncio.to_thread(self.data_fetcher.fetch_listing_data)
 
         # Process the data
         processed_df = await self.raw_data_processor.process_raw_ticker_data(raw_df)
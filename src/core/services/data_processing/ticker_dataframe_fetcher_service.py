@@ -1,5 +1,6 @@
 """Service for fetching ticker data as DataFrame."""
 
+import asyncio
 import pandas as pd
 from src.core.services.raw_data_fetcher_service import RawDataFetcherService
 from src.core.services.data_processing.raw_data_processor_service import (
@@ -32,8 +33,8 @@ class TickerDataFrameFetcherService:
         Returns:
             Processed ticker DataFrame
         """
-        # Fetch raw data
-        raw_df = self.data_fetcher.fetch_listing_data()
+        # Fetch raw data in a worker thread; the HTTP call is blocking
+        raw_df = await asyncio.to_thread(self.data_fetcher.fetch_listing_data)
 
         # Process and return the data
         return await self.raw_data_processor.process_raw_ticker_data(raw_df)
@@ -1,6 +1,5 @@
 """Async functions for data conversion operations."""
 
-import asyncio
 from typing import List
 import pandas as pd
 from src.models.ticker import TickerData
@@ -16,6 +15,4 @@ async def convert_to_ticker_objects(df: pd.DataFrame) -> List[TickerData]:
     Returns:
         List of TickerData objects
     """
-    return [
-        TickerData(ticker=row["ticker"], title=row["title"]) for _, row in df.iterrows()
-    ]
+    return TickerData.from_dataframe(df)
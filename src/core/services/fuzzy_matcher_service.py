@@ -1,6 +1,7 @@
 """Service for orchestrating fuzzy matching with vector scoring."""
 
-from typing import Tuple, Optional
+import threading
+from typing import List, Tuple, Optional
 
 import pandas as pd
 
@@ -40,7 +41,9 @@ class FuzzyMatcherService:
         self.score_calculator = score_calculator or MatchScoreCalculatorService()
         self.result_preparer = result_preparer or MatchResultPreparerService()
         self._is_setup = False
-        self._last_df_id = None
+        self._indexed_df: Optional[pd.DataFrame] = None
+        self._title_list: List[str] = []
+        self._setup_lock = threading.Lock()
 
     def find_fuzzy_matches(
         self, name_processed: str, tickers_df: pd.DataFrame
@@ -57,15 +60,21 @@ class FuzzyMatcherService:
             Format: (matched_name, predicted_ticker, all_possible_tickers, 
                     score, message, top_matches)
         """
-        # Setup vectorization if not already done or dataframe changed
-        current_df_id = id(tickers_df)
-        if not self._is_setup or self._last_df_id != current_df_id:
-            self.vectorizer_setup.setup_vectorization(tickers_df)
-            self._is_setup = True
-            self._last_df_id = current_df_id
+        # Setup vectorization if not already done or dataframe changed; the
+        # frame is compared by reference since id() values get reused, and
+        # locked so concurrent batch matches don't fit the vectorizer twice
+        with self._setup_lock:
+            if not self._is_setup or self._indexed_df is not tickers_df:
+                self.vectorizer_setup.setup_vectorization(tickers_df)
+                # Missing titles can never match, so leave them out
+                self._title_list = (
+                    tickers_df["preprocessed_title"].dropna().tolist()
+                )
+                self._is_setup = True
+                self._indexed_df = tickers_df
+            title_list = self._title_list
 
         # Get initial fuzzy matches
-        title_list = tickers_df["preprocessed_title"].tolist()
         fuzzy_matches = self.fuzzy_finder.find_fuzzy_matches(name_processed, title_list)
 
         # Filter for strong matches
@@ -1,13 +1,20 @@
 """Service for finding exact company name matches."""
 
 import logging
+import threading
 import pandas as pd
-from typing import Optional, Tuple, List
+from typing import Dict, Optional, Tuple, List
 
 
 class ExactMatchFinderService:
     """Service responsible only for finding exact company name matches."""
 
+    def __init__(self):
+        """Initialize the exact match finder with an empty title index."""
+        self._title_index: Dict[str, int] = {}
+        self._indexed_df: Optional[pd.DataFrame] = None
+        self._index_lock = threading.Lock()
+
     def find_exact_match(
         self, company_name: str, tickers_df: pd.DataFrame
     ) -> Optional[Tuple]:
@@ -22,11 +29,9 @@ class ExactMatchFinderService:
             Tuple with match results or None if no exact match found
             Format: (matched_name, predicted_ticker, all_possible_tickers, score, message, top_matches)
         """
-        exact_matches = tickers_df[
-            tickers_df["title"].str.lower() == company_name.lower()
-        ]
+        position = self._get_title_index(tickers_df).get(company_name.lower())
 
-        if exact_matches.empty:
+        if position is None:
             return None
 
         exact_tickers = []
@@ -34,7 +39,7 @@ class ExactMatchFinderService:
 
         # For exact matches, only return the first/best match to avoid confusion
         # Since it's a perfect match, multiple options aren't helpful
-        first_match = exact_matches.iloc[0]
+        first_match = tickers_df.iloc[position]
         ticker = first_match.get("ticker")
 
         if pd.notnull(ticker):
@@ -74,3 +79,27 @@ class ExactMatchFinderService:
             None,  # No error message
             top_matches,
         )
+
+    def _get_title_index(self, tickers_df: pd.DataFrame) -> Dict[str, int]:
+        """
+        Get the lowercased-title to row-position index for a dataframe.
+
+        The index is built once per dataframe and keeps the first row for
+        each title, matching the first row of a boolean-mask scan.
+
+        Args:
+            tickers_df: DataFrame with ticker data
+
+        Returns:
+            Dictionary mapping lowercased titles to row positions
+        """
+        with self._index_lock:
+            if self._indexed_df is not tickers_df:
+                # Keep the first row per title, built with vectorized ops
+                titles = tickers_df["title"].str.lower()
+                first = (titles.notna() & ~titles.duplicated()).to_numpy(dtype=bool)
+                self._title_index = dict(
+                    zip(titles[first].tolist(), first.nonzero()[0].tolist())
+                )
+                self._indexed_df = tickers_df
+            return self._title_index
@@ -1,9 +1,20 @@
 """Service for finding fuzzy matches."""
 
+import threading
 from typing import List, Tuple
-from rapidfuzz import process
+
+import numpy as np
+from rapidfuzz import fuzz, process
+
 from src.config.settings import settings
 
+_thread_state = threading.local()
+
+
+def use_single_worker() -> None:
+    """Score fuzzy matches on the calling thread only (for outer worker pools)."""
+    _thread_state.workers = 1
+
 
 class FuzzyMatchFinderService:
     """Service responsible only for finding fuzzy matches."""
@@ -19,10 +30,34 @@ class FuzzyMatchFinderService:
             title_list: List of preprocessed company titles
 
         Returns:
-            List of fuzzy match tuples
+            List of up to 10 (title, score, index) tuples, best score first
         """
-        matches = process.extract(name_processed, title_list, limit=10)
-        return matches
+        if not title_list:
+            return []
+
+        # Titles are already preprocessed, so skip rapidfuzz's own processor.
+        # cdist splits work by query row, so titles go in as the rows to let
+        # the workers share them; threads of an outer pool score alone.
+        scores = process.cdist(
+            title_list,
+            [name_processed],
+            scorer=fuzz.WRatio,
+            processor=None,
+            dtype=np.float64,
+            workers=getattr(_thread_state, "workers", settings.FUZZY_MATCH_WORKERS),
+        )[:, 0]
+
+        # Select the top 10 in O(N) like process.extract: by score descending,
+        # ties by position in the list. argpartition only finds the 10th-best
+        # score; titles tied with it are then taken lowest position first.
+        limit = min(10, len(scores))
+        kth = scores[np.argpartition(-scores, limit - 1)[limit - 1]]
+        above = np.flatnonzero(scores > kth)
+        ties = np.flatnonzero(scores == kth)[: limit - len(above)]
+        top = np.concatenate((above, ties))
+        top = top[np.lexsort((top, -scores[top]))]
+
+        return [(title_list[i], float(scores[i]), int(i)) for i in top]
 
     def filter_strong_matches(self, fuzzy_matches: List) -> List[Tuple]:
         """
@@ -1,7 +1,7 @@
 """Service responsible only for preparing data for matching operations."""
 
 import pandas as pd
-from src.utils.company_name_cleaner import preprocess_company_name
+from src.utils.company_name_cleaner import preprocess_company_names
 
 
 class DataPreparationService:
@@ -9,15 +9,18 @@ class DataPreparationService:
 
     def add_preprocessed_column(self, tickers_df: pd.DataFrame) -> pd.DataFrame:
         """
-        Add a preprocessed column to the tickers dataframe.
+        Add a preprocessed column to the tickers dataframe in place.
+
+        The column is assigned on the given frame rather than on a copy, so
+        refreshing a large ticker cache doesn't hold two copies of it.
 
         Args:
             tickers_df: DataFrame with ticker data
 
         Returns:
-            DataFrame with added preprocessed_title column
+            The same DataFrame, with the preprocessed_title column added
         """
-        tickers_df["preprocessed_title"] = tickers_df["title"].apply(
-            preprocess_company_name
+        tickers_df["preprocessed_title"] = preprocess_company_names(
+            tickers_df["title"]
         )
         return tickers_df
@@ -37,25 +37,77 @@ class OpenAIFallbackService:
                 name, candidates
             )
 
-            if openai_result == "None" or selected is None:
-                return None, None, [], 0, "Company is not in public company list", []
-
-            logging.info("OpenAI score: %s", selected["score"])
-            return (
-                selected["company_name"],
-                selected["ticker"],
-                [selected["ticker"]],
-                selected["score"],
-                None,
-                [
-                    {
-                        "Rank": 1,
-                        "company_name": selected["company_name"],
-                        "ticker": selected["ticker"],
-                        "name_match_score": selected["score"],
-                    }
-                ],
-            )
+            return self._format_fallback_result(openai_result, selected)
         except Exception as e:
             logging.error("OpenAI fallback failed: %s", e)
             return None, None, [], 0, "OpenAI service error", []
+
+    def try_openai_fallback_many(
+        self, items: List[Tuple[str, List[Dict]]]
+    ) -> List[Tuple]:
+        """
+        Try OpenAI fallback for several company names with a single request.
+
+        Falls back to one request per name if the batched request fails or
+        returns an answer list that cannot be aligned with the inputs.
+
+        Args:
+            items: List of (name, candidates) pairs
+
+        Returns:
+            List of match result tuples, in input order
+        """
+        if not self.openai_service:
+            return [
+                (None, None, [], 0, "OpenAI service not available", []) for _ in items
+            ]
+
+        try:
+            answers = self.openai_service.match_many(items)
+        except Exception as e:
+            logging.warning(
+                "Batched OpenAI fallback failed, retrying per name: %s", e
+            )
+            return [
+                self.try_openai_fallback(name, candidates)
+                for name, candidates in items
+            ]
+
+        return [
+            self._format_fallback_result(openai_result, selected)
+            for openai_result, selected in answers
+        ]
+
+    @staticmethod
+    def _format_fallback_result(
+        openai_result: str, selected: Optional[Dict]
+    ) -> Tuple:
+        """
+        Format an OpenAI answer into a match result tuple.
+
+        Args:
+            openai_result: Raw OpenAI answer
+            selected: Candidate selected from the answer, if any
+
+        Returns:
+            Tuple with match results
+        """
+        if openai_result == "None" or selected is None:
+            return None, None, [], 0, "Company is not in public company list", []
+
+        logging.info("OpenAI score: %s", selected["score"])
+        return (
+            selected["company_name"],
+            selected["ticker"],
+            [selected["ticker"]],
+            selected["score"],
+            None,
+            [
+                {
+                    "Rank": 1,
+                    "company_name": selected["company_name"],
+                    "ticker": selected["ticker"],
+                    "name_match_score": selected["score"],
+                }
+            ],
+        )
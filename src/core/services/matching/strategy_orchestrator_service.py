@@ -1,14 +1,20 @@
 """Service responsible only for orchestrating matching strategies."""
 
 import logging
-from typing import Tuple, Optional
+from typing import TYPE_CHECKING, Dict, List, Tuple, Optional
 import pandas as pd
 
+from src.config.settings import settings
 from src.utils.company_name_cleaner import preprocess_company_name
 from src.core.services.exact_matcher_service import ExactMatcherService
 from src.core.services.fuzzy_matcher_service import FuzzyMatcherService
 from src.core.services.openai_service import OpenAIService
 
+if TYPE_CHECKING:
+    from src.core.services.matching.openai_fallback_service import (
+        OpenAIFallbackService,
+    )
+
 
 class StrategyOrchestratorService:
     """Service responsible only for orchestrating matching strategies."""
@@ -44,40 +50,93 @@ class StrategyOrchestratorService:
         Returns:
             Tuple with match results
         """
+        result, candidates = self.match_without_fallback(name, tickers_df)
+        if result is not None:
+            return result
+
+        # 3. Try OpenAI fallback
+        return self._get_fallback_service().try_openai_fallback(name, candidates)
+
+    def match_without_fallback(
+        self, name: str, tickers_df: pd.DataFrame
+    ) -> Tuple[Optional[Tuple], List[Dict]]:
+        """
+        Run the exact and fuzzy strategies, stopping short of the OpenAI fallback.
+
+        Args:
+            name: Company name to match
+            tickers_df: DataFrame with ticker data
+
+        Returns:
+            Tuple of (match result, OpenAI candidates). The match result is
+            None when the name still needs the OpenAI fallback with the
+            returned candidates.
+        """
         if not isinstance(name, str):
             logging.warning("Input name is not a string: %s", name)
-            return None, None, [], 0, "Company is not in public company list", []
+            return (None, None, [], 0, "Company is not in public company list", []), []
 
         # 1. Try exact matching first
         exact_result = self.exact_matcher.find_exact_match(name, tickers_df)
         if exact_result:
-            return exact_result
+            return exact_result, []
 
         # 2. Try fuzzy matching
         name_processed = preprocess_company_name(name)
         fuzzy_result = self.fuzzy_matcher.find_fuzzy_matches(name_processed, tickers_df)
 
         if fuzzy_result[0] is not None:
-            return fuzzy_result
+            return fuzzy_result, []
 
-        # 3. Try OpenAI fallback if available
-        if self.openai_service and self.openai_service.is_available():
-            from src.core.services.matching.openai_candidate_preparer_service import (
-                OpenAICandidatePreparerService,
-            )
-            from src.core.services.matching.openai_fallback_service import (
-                OpenAIFallbackService,
-            )
+        if not (self.openai_service and self.openai_service.is_available()):
+            return (None, None, [], 0, "Company is not in public company list", []), []
+
+        from src.core.services.matching.openai_candidate_preparer_service import (
+            OpenAICandidatePreparerService,
+        )
+
+        fallback_matches = fuzzy_result[5]  # Get the fallback matches from fuzzy result
+        candidates = OpenAICandidatePreparerService().prepare_openai_candidates(
+            fallback_matches, tickers_df
+        )
+        return None, candidates
+
+    def orchestrate_openai_fallback_many(
+        self, items: List[Tuple[str, List[Dict]]]
+    ) -> List[Tuple]:
+        """
+        Run the OpenAI fallback for several names, batching the requests.
 
-            candidate_preparer = OpenAICandidatePreparerService()
-            fallback_service = OpenAIFallbackService(self.openai_service)
+        Args:
+            items: List of (name, candidates) pairs from match_without_fallback
 
-            fallback_matches = fuzzy_result[
-                5
-            ]  # Get the fallback matches from fuzzy result
-            candidates = candidate_preparer.prepare_openai_candidates(
-                fallback_matches, tickers_df
+        Returns:
+            List of match result tuples, in input order
+        """
+        fallback_service = self._get_fallback_service()
+        batch_size = max(1, settings.OPENAI_BATCH_SIZE)
+
+        results: List[Tuple] = []
+        for start in range(0, len(items), batch_size):
+            results.extend(
+                fallback_service.try_openai_fallback_many(
+                    items[start : start + batch_size]
+                )
             )
-            return fallback_service.try_openai_fallback(name, candidates)
+        return results
 
-        return None, None, [], 0, "Company is not in public company list", []
+    def _get_fallback_service(self) -> "OpenAIFallbackService":
+        """
+        Create the OpenAI fallback service for the configured OpenAI service.
+
+        Raises:
+            RuntimeError: If no OpenAI service is configured
+        """
+        from src.core.services.matching.openai_fallback_service import (
+            OpenAIFallbackService,
+        )
+
+        # match_without_fallback only defers to OpenAI when a service is set
+        if self.openai_service is None:
+            raise RuntimeError("OpenAI fallback requested without an OpenAI service")
+        return OpenAIFallbackService(self.openai_service)
@@ -49,6 +49,25 @@ class OpenAIService:
         # Process the response
         return self.response_processor.process_matching_response(answer, candidates)
 
+    def match_many(
+        self, items: List[Tuple[str, List[Dict]]]
+    ) -> List[Tuple[str, Optional[Dict]]]:
+        """
+        Use a single OpenAI request to select the best match for several names.
+
+        Args:
+            items: List of (company_name, candidates) pairs
+
+        Returns:
+            List of (openai_response, selected_candidate) tuples, in input order
+        """
+        answers = self.request_service.make_batch_matching_request(items)
+
+        return [
+            self.response_processor.process_matching_response(answer, candidates)
+            for answer, (_, candidates) in zip(answers, items)
+        ]
+
     def is_available(self) -> bool:
         """
         Check if OpenAI service is available (API key is set).
@@ -1,8 +1,10 @@
 """Service for orchestrating ticker data update process."""
 
+import asyncio
 import pandas as pd
 from typing import List, Optional
 from src.models.ticker import TickerData
+from src.database.repositories.database import TickerDataFrameSaverService
 from src.core.services.raw_data_fetcher_service import RawDataFetcherService
 from src.core.services.data_processing.raw_data_processor_service import (
     RawDataProcessorService,
@@ -73,6 +75,26 @@ class TickerUpdaterService:
         """
         return await self.ticker_dataframe_fetcher.fetch_ticker_dataframe()
 
+    async def fetch_and_persist(
+        self, saver: TickerDataFrameSaverService
+    ) -> pd.DataFrame:
+        """
+        Fetch ticker data and save it without blocking the event loop.
+
+        The synchronous database save runs in a worker thread so other
+        requests keep being served while it waits on the database.
+
+        Args:
+            saver: Service for saving the ticker DataFrame
+
+        Returns:
+            The fetched ticker DataFrame (not saved when empty)
+        """
+        tickers_df = await self.fetch_ticker_dataframe()
+        if not tickers_df.empty:
+            await asyncio.to_thread(saver.save_tickers_dataframe, tickers_df)
+        return tickers_df
+
     def health_check(self) -> bool:
         """
         Check if the service and its dependencies are healthy.
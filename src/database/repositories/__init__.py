@@ -6,6 +6,8 @@ from .database.ticker_loader_service import TickerLoaderService
 from .database.ticker_saver_service import TickerSaverService
 from .database.metadata_service import MetadataService
 from .database.database_health_service import DatabaseHealthService
+from .database.ticker_cache_service import TickerCacheService
+from .database.ticker_upsert_service import TickerUpsertService
 
 __all__ = [
     "TickerDataFrameLoaderService",
@@ -14,4 +16,6 @@ __all__ = [
     "TickerSaverService",
     "MetadataService",
     "DatabaseHealthService",
+    "TickerCacheService",
+    "TickerUpsertService",
 ]
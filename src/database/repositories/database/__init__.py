@@ -6,6 +6,8 @@ from .ticker_saver_service import TickerSaverService
 from .ticker_dataframe_saver_service import TickerDataFrameSaverService
 from .metadata_service import MetadataService
 from .database_health_service import DatabaseHealthService
+from .ticker_cache_service import TickerCacheService
+from .ticker_upsert_service import TickerUpsertService
 
 __all__ = [
     "TickerLoaderService",
@@ -14,4 +16,6 @@ __all__ = [
     "TickerDataFrameSaverService",
     "MetadataService",
     "DatabaseHealthService",
+    "TickerCacheService",
+    "TickerUpsertService",
 ]
@@ -1,33 +1,60 @@
 """Service for database health checks."""
 
 import logging
-from sqlalchemy import create_engine, text
+import time
+from typing import Optional
+from sqlalchemy import Engine, create_engine
+from src.config.settings import settings
 
 
 class DatabaseHealthService:
     """Service responsible only for database health checks."""
 
-    def __init__(self, database_url: str):
+    def __init__(self, database_url: str, cache_ttl: Optional[float] = None):
         """
         Initialize the database health service.
 
         Args:
             database_url: Database connection URL
+            cache_ttl: Seconds to reuse the last health result (defaults to settings)
         """
         self.database_url = database_url
+        self.cache_ttl = (
+            settings.HEALTH_CHECK_CACHE_TTL_SECONDS if cache_ttl is None else cache_ttl
+        )
+        self._engine: Optional[Engine] = None
+        self._last_result: Optional[bool] = None
+        self._last_checked: float = 0.0
+
+    @property
+    def engine(self) -> Engine:
+        """Get the pooled engine, creating it on first use."""
+        if self._engine is None:
+            self._engine = create_engine(self.database_url, pool_pre_ping=True)
+        return self._engine
 
     def health_check(self) -> bool:
         """
         Check if database connection is healthy.
 
+        Results are reused for ``cache_ttl`` seconds so frequent polling does
+        not pay a database round-trip on every call.
+
         Returns:
             True if connection is healthy, False otherwise
         """
+        now = time.monotonic()
+        if self._last_result is not None and now - self._last_checked < self.cache_ttl:
+            return self._last_result
+
         try:
-            engine = create_engine(self.database_url)
-            with engine.connect() as connection:
-                connection.execute(text("SELECT 1"))
-            return True
+            with self.engine.connect() as connection:
+                connection.exec_driver_sql("SELECT 1")
+            result = True
         except Exception as e:
             logging.error("Database health check failed: %s", e)
-            return False
+            result = False
+
+        self._last_result = result
+        self._last_checked = now
+        return result
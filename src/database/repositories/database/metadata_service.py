@@ -3,8 +3,8 @@
 import logging
 import pandas as pd
 import pytz
-from typing import Dict, Any
-from sqlalchemy import create_engine, text
+from typing import Dict, Any, Optional
+from sqlalchemy import Connection, create_engine, text
 
 
 class MetadataService:
@@ -19,34 +19,52 @@ class MetadataService:
         """
         self.database_url = database_url
 
-    def update_last_updated(self) -> None:
-        """Update the last updated timestamp in metadata table."""
+    def update_last_updated(self, connection: Optional[Connection] = None) -> None:
+        """
+        Update the last updated timestamp in metadata table.
+
+        Args:
+            connection: Open connection to run the update on. When given, the
+                statements join the caller's transaction and are committed by
+                the caller; otherwise a dedicated transaction is used.
+        """
         try:
+            if connection is not None:
+                self._write_last_updated(connection)
+                return
+
             engine = create_engine(self.database_url)
-            with engine.connect() as connection:
-                # Ensure metadata table exists
-                connection.execute(
-                    text(
-                        "CREATE TABLE IF NOT EXISTS metadata (key TEXT PRIMARY KEY, value TEXT)"
-                    )
-                )
-
-                # Update timestamp
-                timestamp = pd.Timestamp.now(tz="UTC").isoformat()
-                connection.execute(
-                    text(
-                        "INSERT INTO metadata (key, value) VALUES ('last_updated', :timestamp) "
-                        "ON CONFLICT (key) DO UPDATE SET value = :timestamp"
-                    ),
-                    {"timestamp": timestamp},
-                )
-
-                connection.commit()
+            with engine.begin() as own_connection:
+                self._write_last_updated(own_connection)
 
         except Exception as e:
             logging.error("Error updating last_updated timestamp: %s", e)
             raise
 
+    def _write_last_updated(self, connection: Connection) -> None:
+        """
+        Write the last updated timestamp using the given connection.
+
+        Args:
+            connection: Open connection inside an active transaction
+        """
+        # Ensure metadata table exists
+        connection.execute(
+            text(
+                "CREATE TABLE IF NOT EXISTS metadata (key TEXT PRIMARY KEY, value TEXT)"
+            )
+        )
+
+        # Update timestamp
+        timestamp = pd.Timestamp.now(tz="UTC").isoformat()
+        connection.execute(
+            text(
+                "INSERT INTO metadata (key, value) VALUES ('last_updated', :timestamp) "
+                "ON CONFLICT (key) DO UPDATE SET value = :timestamp"
+            ),
+            {"timestamp": timestamp},
+        )
+
     def get_last_update_time(self, timezone: str = "UTC") -> Dict[str, Any]:
         """
         Get the last update time from the database.
@@ -0,0 +1,92 @@
+"""Service for caching ticker table data in process memory."""
+
+import threading
+import time
+from typing import Any, Dict, Optional, Tuple
+
+from src.config.settings import settings
+
+
+class TickerCacheService:
+    """Service responsible only for caching loaded ticker data per database."""
+
+    def __init__(self, ttl_seconds: Optional[float] = None):
+        """
+        Initialize the ticker cache service.
+
+        Args:
+            ttl_seconds: Seconds a cached load stays valid (defaults to settings)
+        """
+        self.ttl_seconds = (
+            settings.TICKER_CACHE_TTL_SECONDS if ttl_seconds is None else ttl_seconds
+        )
+        self._lock = threading.Lock()
+        self._entries: Dict[Tuple[str, str], Tuple[Any, float]] = {}
+        self._versions: Dict[str, int] = {}
+
+    def get_version(self, database_url: str) -> int:
+        """
+        Get the current data version for a database.
+
+        Args:
+            database_url: Database connection URL
+
+        Returns:
+            Version counter, bumped on every invalidation
+        """
+        with self._lock:
+            return self._versions.get(database_url, 0)
+
+    def get(self, database_url: str, kind: str) -> Optional[Any]:
+        """
+        Get a cached value if it is still within its TTL.
+
+        Args:
+            database_url: Database connection URL
+            kind: Name of the cached representation (e.g. "dataframe")
+
+        Returns:
+            Cached value, or None on a miss or expired entry
+        """
+        with self._lock:
+            entry = self._entries.get((database_url, kind))
+            if entry is None:
+                return None
+
+            value, loaded_at = entry
+            if time.monotonic() - loaded_at >= self.ttl_seconds:
+                del self._entries[(database_url, kind)]
+                return None
+
+            return value
+
+    def set(self, database_url: str, kind: str, value: Any, version: int) -> None:
+        """
+        Store a loaded value unless the data was invalidated while loading.
+
+        Args:
+            database_url: Database connection URL
+            kind: Name of the cached representation (e.g. "dataframe")
+            value: Value to cache
+            version: Version read via get_version before the load started
+        """
+        with self._lock:
+            if self._versions.get(database_url, 0) != version:
+                return
+            self._entries[(database_url, kind)] = (value, time.monotonic())
+
+    def invalidate(self, database_url: str) -> None:
+        """
+        Drop all cached values for a database and bump its version.
+
+        Args:
+            database_url: Database connection URL
+        """
+        with self._lock:
+            self._versions[database_url] = self._versions.get(database_url, 0) + 1
+            for key in [key for key in self._entries if key[0] == database_url]:
+                del self._entries[key]
+
+
+# Process-wide cache shared by the loader and saver services
+shared_ticker_cache = TickerCacheService()
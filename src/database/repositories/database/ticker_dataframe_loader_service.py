@@ -2,33 +2,69 @@
 
 import logging
 import pandas as pd
-from sqlalchemy import create_engine
+from typing import Optional
+from sqlalchemy import create_engine, text
+from src.config.settings import settings
+from .ticker_cache_service import TickerCacheService, shared_ticker_cache
+
+TICKER_COLUMNS = ["ticker", "title"]
 
 
 class TickerDataFrameLoaderService:
     """Service responsible only for loading ticker data as DataFrame from database."""
 
-    def __init__(self, database_url: str):
+    def __init__(
+        self, database_url: str, ticker_cache: Optional[TickerCacheService] = None
+    ):
         """
         Initialize the ticker dataframe loader service.
 
         Args:
             database_url: Database connection URL
+            ticker_cache: In-process cache for loaded tickers
         """
         self.database_url = database_url
+        self.ticker_cache = ticker_cache or shared_ticker_cache
 
-    def load_tickers_dataframe(self) -> pd.DataFrame:
+    def load_tickers_dataframe(self, use_cache: bool = True) -> pd.DataFrame:
         """
         Load ticker data as a pandas DataFrame.
 
+        Rows are streamed through a server-side cursor in batches of
+        ``settings.DB_FETCH_BATCH_SIZE`` so the driver never buffers the
+        whole table on the client.
+
+        Args:
+            use_cache: Whether to serve cached data; when False the database
+                is always queried and the cache is refreshed with the result
+
         Returns:
             DataFrame with ticker data
         """
+        if use_cache:
+            cached = self.ticker_cache.get(self.database_url, "dataframe")
+            if cached is not None:
+                return cached.copy()
+
+        version = self.ticker_cache.get_version(self.database_url)
         try:
             engine = create_engine(self.database_url)
-            with engine.connect() as connection:
-                return pd.read_sql("SELECT ticker, title FROM tickers", connection)
+            with engine.connect().execution_options(
+                stream_results=True, yield_per=settings.DB_FETCH_BATCH_SIZE
+            ) as connection:
+                result = connection.execute(text("SELECT ticker, title FROM tickers"))
+                frames = [
+                    pd.DataFrame(partition, columns=TICKER_COLUMNS)
+                    for partition in result.partitions()
+                ]
+
+            if not frames:
+                return pd.DataFrame(columns=TICKER_COLUMNS)
+
+            df = pd.concat(frames, ignore_index=True)
+            self.ticker_cache.set(self.database_url, "dataframe", df, version)
+            return df.copy()
 
         except Exception as e:
             logging.error("Error loading tickers from database: %s", e)
-            return pd.DataFrame(columns=["ticker", "title"])
+            return pd.DataFrame(columns=TICKER_COLUMNS)
@@ -5,13 +5,19 @@ import pandas as pd
 from typing import Optional
 from sqlalchemy import create_engine
 from .metadata_service import MetadataService
+from .ticker_cache_service import TickerCacheService, shared_ticker_cache
+from .ticker_upsert_service import TickerUpsertService
 
 
 class TickerDataFrameSaverService:
     """Service responsible only for saving ticker DataFrame to database."""
 
     def __init__(
-        self, database_url: str, metadata_service: Optional[MetadataService] = None
+        self,
+        database_url: str,
+        metadata_service: Optional[MetadataService] = None,
+        ticker_cache: Optional[TickerCacheService] = None,
+        upsert_service: Optional[TickerUpsertService] = None,
     ):
         """
         Initialize the ticker dataframe saver service.
@@ -19,9 +25,13 @@ class TickerDataFrameSaverService:
         Args:
             database_url: Database connection URL
             metadata_service: Service for updating metadata
+            ticker_cache: In-process ticker cache to invalidate after saving
+            upsert_service: Service for merging rows into the tickers table
         """
         self.database_url = database_url
         self.metadata_service = metadata_service or MetadataService(database_url)
+        self.ticker_cache = ticker_cache or shared_ticker_cache
+        self.upsert_service = upsert_service or TickerUpsertService()
 
     def save_tickers_dataframe(self, df: pd.DataFrame) -> None:
         """
@@ -29,13 +39,24 @@ class TickerDataFrameSaverService:
 
         Args:
             df: DataFrame with ticker and title columns
+
+        Raises:
+            ValueError: If the DataFrame is missing the ticker or title column
         """
+        missing_columns = {"ticker", "title"} - set(df.columns)
+        if missing_columns:
+            raise ValueError(
+                f"DataFrame is missing required columns: {sorted(missing_columns)}"
+            )
+
         try:
+            # Merge the rows and stamp metadata in a single transaction
             engine = create_engine(self.database_url)
-            df.to_sql("tickers", engine, if_exists="replace", index=False)
+            with engine.begin() as connection:
+                self.upsert_service.upsert_tickers(df, connection)
+                self.metadata_service.update_last_updated(connection)
 
-            # Update metadata
-            self.metadata_service.update_last_updated()
+            self.ticker_cache.invalidate(self.database_url)
 
             logging.info("Successfully saved %d tickers to database", len(df))
 
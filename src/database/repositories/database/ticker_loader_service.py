@@ -1,23 +1,27 @@
 """Service for loading ticker data from database."""
 
 import logging
-import pandas as pd
-from typing import List
-from sqlalchemy import create_engine
+from typing import List, Optional
+from sqlalchemy import create_engine, text
 from src.models.ticker import TickerData
+from .ticker_cache_service import TickerCacheService, shared_ticker_cache
 
 
 class TickerLoaderService:
     """Service responsible only for loading ticker data from database."""
 
-    def __init__(self, database_url: str):
+    def __init__(
+        self, database_url: str, ticker_cache: Optional[TickerCacheService] = None
+    ):
         """
         Initialize the ticker loader service.
 
         Args:
             database_url: Database connection URL
+            ticker_cache: In-process cache for loaded tickers
         """
         self.database_url = database_url
+        self.ticker_cache = ticker_cache or shared_ticker_cache
 
     def load_tickers(self) -> List[TickerData]:
         """
@@ -26,15 +30,21 @@ class TickerLoaderService:
         Returns:
             List of TickerData objects
         """
+        cached = self.ticker_cache.get(self.database_url, "tickers")
+        if cached is not None:
+            return list(cached)
+
+        version = self.ticker_cache.get_version(self.database_url)
         try:
             engine = create_engine(self.database_url)
             with engine.connect() as connection:
-                df = pd.read_sql("SELECT ticker, title FROM tickers", connection)
+                result = connection.execute(text("SELECT ticker, title FROM tickers"))
+                tickers = [
+                    TickerData(ticker=row.ticker, title=row.title) for row in result
+                ]
 
-            return [
-                TickerData(ticker=row["ticker"], title=row["title"])
-                for _, row in df.iterrows()
-            ]
+            self.ticker_cache.set(self.database_url, "tickers", tickers, version)
+            return list(tickers)
 
         except Exception as e:
             logging.error("Error loading tickers from database: %s", e)
@@ -1,18 +1,25 @@
 """Service for saving ticker objects to database."""
 
 import logging
+import numpy as np
 import pandas as pd
 from typing import List, Optional
 from sqlalchemy import create_engine
 from src.models.ticker import TickerData
 from .metadata_service import MetadataService
+from .ticker_cache_service import TickerCacheService, shared_ticker_cache
+from .ticker_upsert_service import TickerUpsertService
 
 
 class TickerSaverService:
     """Service responsible only for saving ticker objects to database."""
 
     def __init__(
-        self, database_url: str, metadata_service: Optional[MetadataService] = None
+        self,
+        database_url: str,
+        metadata_service: Optional[MetadataService] = None,
+        ticker_cache: Optional[TickerCacheService] = None,
+        upsert_service: Optional[TickerUpsertService] = None,
     ):
         """
         Initialize the ticker saver service.
@@ -20,9 +27,13 @@ class TickerSaverService:
         Args:
             database_url: Database connection URL
             metadata_service: Service for updating metadata
+            ticker_cache: In-process ticker cache to invalidate after saving
+            upsert_service: Service for merging rows into the tickers table
         """
         self.database_url = database_url
         self.metadata_service = metadata_service or MetadataService(database_url)
+        self.ticker_cache = ticker_cache or shared_ticker_cache
+        self.upsert_service = upsert_service or TickerUpsertService()
 
     def save_tickers(self, ticker_data: List[TickerData]) -> None:
         """
@@ -32,16 +43,22 @@ class TickerSaverService:
             ticker_data: List of TickerData objects to save
         """
         try:
-            # Convert to DataFrame for bulk insert
-            df = pd.DataFrame(
-                [{"ticker": td.ticker, "title": td.title} for td in ticker_data]
-            )
+            # Convert to DataFrame for bulk insert, one preallocated array per column
+            count = len(ticker_data)
+            tickers = np.empty(count, dtype=object)
+            titles = np.empty(count, dtype=object)
+            for i, td in enumerate(ticker_data):
+                tickers[i] = td.ticker
+                titles[i] = td.title
+            df = pd.DataFrame({"ticker": tickers, "title": titles}, copy=False)
 
+            # Merge the rows and stamp metadata in a single transaction
             engine = create_engine(self.database_url)
-            df.to_sql("tickers", engine, if_exists="replace", index=False)
+            with engine.begin() as connection:
+                self.upsert_service.upsert_tickers(df, connection)
+                self.metadata_service.update_last_updated(connection)
 
-            # Update metadata
-            self.metadata_service.update_last_updated()
+            self.ticker_cache.invalidate(self.database_url)
 
             logging.info("Successfully saved %d tickers to database", len(ticker_data))
 
@@ -0,0 +1,78 @@
+"""Service for merging ticker data into the tickers table."""
+
+import pandas as pd
+from sqlalchemy import Connection, text
+from src.config.settings import settings
+
+
+class TickerUpsertService:
+    """Service responsible only for upserting ticker rows by ticker key."""
+
+    def upsert_tickers(self, df: pd.DataFrame, connection: Connection) -> None:
+        """
+        Merge ticker rows into the tickers table within the caller's transaction.
+
+        The incoming rows are staged in a ``tickers_staging`` temp table that
+        is private to the connection and dropped on commit, then merged with
+        INSERT ... ON CONFLICT, so unchanged rows and the ticker index are left
+        untouched. Tickers absent from the incoming data are deleted.
+
+        Args:
+            df: DataFrame with ticker and title columns
+            connection: Open connection inside an active transaction
+        """
+        connection.execute(
+            text(
+                "CREATE TABLE IF NOT EXISTS tickers "
+                "(ticker TEXT NOT NULL, title TEXT)"
+            )
+        )
+        index_exists = connection.execute(
+            text("SELECT to_regclass('tickers_ticker_key') IS NOT NULL")
+        ).scalar()
+        if not index_exists:
+            # Tables written before the index existed may repeat tickers;
+            # keep one row per ticker so the unique index can be built
+            connection.execute(
+                text(
+                    "DELETE FROM tickers a USING tickers b "
+                    "WHERE a.ticker = b.ticker AND a.ctid > b.ctid"
+                )
+            )
+            connection.execute(
+                text(
+                    "CREATE UNIQUE INDEX IF NOT EXISTS tickers_ticker_key "
+                    "ON tickers (ticker)"
+                )
+            )
+
+        connection.execute(
+            text(
+                "CREATE TEMP TABLE tickers_staging "
+                "(ticker TEXT, title TEXT) ON COMMIT DROP"
+            )
+        )
+        df[["ticker", "title"]].to_sql(
+            "tickers_staging",
+            connection,
+            if_exists="append",
+            index=False,
+            method="multi",
+            chunksize=settings.DB_WRITE_CHUNK_SIZE,
+        )
+
+        connection.execute(
+            text(
+                "INSERT INTO tickers (ticker, title) "
+                "SELECT DISTINCT ON (ticker) ticker, title FROM tickers_staging "
+                "WHERE ticker IS NOT NULL ORDER BY ticker "
+                "ON CONFLICT (ticker) DO UPDATE SET title = EXCLUDED.title "
+                "WHERE tickers.title IS DISTINCT FROM EXCLUDED.title"
+            )
+        )
+        connection.execute(
+            text(
+                "DELETE FROM tickers WHERE NOT EXISTS "
+                "(SELECT 1 FROM tickers_staging s WHERE s.ticker = tickers.ticker)"
+            )
+        )
@@ -56,3 +56,53 @@ Examples of correct responses:
 Best match or legal company name with ticker:"""
 
         return prompt
+
+    @staticmethod
+    def get_batch_company_matching_prompt(items: list) -> str:
+        """
+        Get the prompt for matching several company names in one request.
+
+        Args:
+            items: List of (company_name, candidates) pairs
+
+        Returns:
+            Formatted prompt string for OpenAI asking for a JSON array answer
+        """
+        inputs_text = ""
+        for i, (company_name, candidates) in enumerate(items, 1):
+            inputs_text += f"\nInput {i}: {company_name}\nCandidates:\n"
+            for j, candidate in enumerate(candidates, 1):
+                inputs_text += (
+                    f"  {j}. {candidate['company_name']} "
+                    f"(Ticker: {candidate['ticker']})\n"
+                )
+
+        prompt = f"""
+You are an expert at matching company names and understanding the difference between brand names and legal company names.
+
+TASK: For EACH numbered input below, find the best match from that input's candidate list OR identify the correct legal company name and ticker if the input is a well-known brand/common name.
+
+RULES:
+1. FIRST: Check if the input directly matches any of its candidates (even with misspellings)
+2. SECOND: If no direct match, consider if the input is a well-known brand name for a public company
+3. Examples of brand name mappings with tickers:
+   - "Google" → "Alphabet Inc. (Ticker: GOOGL)"
+   - "Facebook" → "Meta Platforms Inc. (Ticker: META)"
+   - "Tesla" → "Tesla Inc. (Ticker: TSLA)"
+   - "Amazon" → "Amazon.com Inc. (Ticker: AMZN)"
+   - "Apple" → "Apple Inc. (Ticker: AAPL)"
+   - "AMD" → "Advanced Micro Devices Inc. (Ticker: AMD)"
+   - "IBM" → "International Business Machines Corporation (Ticker: IBM)"
+{inputs_text}
+ANSWER FORMAT for each input:
+- If you find a match in its candidates: the exact company name from its list
+- If the input is a well-known brand name but not in its candidates: the actual legal company name and ticker in this format: "Company Name (Ticker: SYMBOL)"
+- If you're unsure or the company is not well-known: 'None'
+
+RESPONSE FORMAT:
+Reply with ONLY a JSON array of exactly {len(items)} strings, one answer per input, in input order.
+Example: ["Alphabet Inc. (Ticker: GOOGL)", "None"]
+
+JSON array:"""
+
+        return prompt
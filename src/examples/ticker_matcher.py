@@ -17,10 +17,13 @@ project_root = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(_
 if project_root not in sys.path:
     sys.path.insert(0, project_root)
 
+import hashlib
 import logging
+import threading
 import time
-from dataclasses import asdict
-from typing import Optional, Dict, Any, List
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from typing import Optional, Dict, Any, List, Tuple
 
 import pandas as pd
 
@@ -36,8 +39,15 @@ from src.core.services.matching import (
     DataPreparationService,
     StrategyOrchestratorService,
 )
+from src.core.services.matchers.fuzzy_match_finder_service import use_single_worker
 from src.config.settings import settings
 
+# Ticker columns kept as Arrow-backed strings in the cached DataFrame
+ARROW_STRING_COLUMNS = ("ticker", "title", "preprocessed_title")
+
+# Message of a definitive no-match; other no-ticker results are failures
+NO_MATCH_MESSAGE = "Company is not in public company list"
+
 
 class TickerMatcher:
     """
@@ -47,8 +57,18 @@ class TickerMatcher:
     Follows Python best practices with proper initialization and error handling.
     """
 
+    # Ticker data shared by every instance, keyed by database URL and
+    # holding (DataFrame, load timestamp)
+    _shared_cache: Dict[str, Tuple[pd.DataFrame, float]] = {}
+    _shared_cache_lock = threading.RLock()
+
     def __init__(
-        self, database_url: str, api_key: Optional[str] = None, log_level: str = "INFO"
+        self,
+        database_url: str,
+        api_key: Optional[str] = None,
+        log_level: str = "INFO",
+        cache_size: int = 1024,
+        cache_dir: Optional[str] = None,
     ):
         """
         Initialize the TickerMatcher with required configuration.
@@ -60,6 +80,10 @@ class TickerMatcher:
             database_url: PostgreSQL database connection URL (required)
             api_key: OpenAI API key for fallback matching (optional)
             log_level: Logging level (DEBUG, INFO, WARNING, ERROR)
+            cache_size: Maximum number of match results kept in the LRU cache
+                (0 disables result caching)
+            cache_dir: Directory for a Feather copy of the ticker data that
+                survives process restarts (optional, disabled by default)
         """
         # Validate required parameters
         if not database_url:
@@ -68,6 +92,8 @@ class TickerMatcher:
         # Setup logging
         logging.basicConfig(level=getattr(logging, log_level.upper()))
         self.logger = logging.getLogger(__name__)
+        # Checked once so the per-match success log costs nothing when disabled
+        self._info_enabled = self.logger.isEnabledFor(logging.INFO)
 
         # Configuration - no os.environ usage, all passed through constructor
         self.api_key = api_key
@@ -76,10 +102,17 @@ class TickerMatcher:
         # Initialize core services
         self._setup_services()
 
-        # Cache for ticker data
-        self._ticker_data_cache: Optional[pd.DataFrame] = None
-        self._cache_timestamp: Optional[float] = None
+        # Ticker data lives in the class-level _shared_cache
         self._cache_ttl = 300  # 5 minutes cache TTL
+        self._cache_dir = cache_dir
+
+        # LRU cache of match results keyed by the stripped, lowercased name
+        # (what the exact and fuzzy stages depend on), valid only for the
+        # ticker DataFrame it was filled against
+        self._match_cache: "OrderedDict[str, Tuple]" = OrderedDict()
+        self._match_cache_size = cache_size
+        self._match_cache_source: Optional[pd.DataFrame] = None
+        self._match_cache_lock = threading.Lock()
 
         self.logger.info("TickerMatcher initialized successfully")
 
@@ -104,80 +137,284 @@ class TickerMatcher:
                 'success': bool
             }
         """
-        try:
-            start_time = time.time()
+        return self._match_with_df(company_name, None, use_cache)
 
-            # Validate input
-            if not company_name or not isinstance(company_name, str):
-                return self._error_response("Invalid company name provided", start_time)
+    def batch_match(
+        self, company_names: List[str], use_cache: bool = True
+    ) -> List[Dict[str, Any]]:
+        """
+        Match multiple company names in batch.
 
-            company_name = company_name.strip()
-            if not company_name:
-                return self._error_response("Empty company name provided", start_time)
+        Ticker data is loaded once and names that differ only in case or
+        surrounding whitespace are matched once, with the result fanned back out. The exact/fuzzy
+        strategies run concurrently on a bounded thread pool, and names that
+        still need the OpenAI fallback are then resolved together with
+        batched requests instead of one request per name.
 
-            # Load ticker data
-            tickers_df = self._get_ticker_data(use_cache)
-            if tickers_df.empty:
-                return self._error_response("No ticker data available", start_time)
+        Args:
+            company_names: List of company names to match
+            use_cache: Whether to use cached ticker data
 
-            # Prepare data for matching
-            tickers_df = self.data_preparer.add_preprocessed_column(tickers_df)
+        Returns:
+            List of match result dictionaries, in input order
+        """
+        if not isinstance(company_names, list):
+            raise ValueError("company_names must be a list")
 
-            # Perform matching using orchestrated strategy
-            result = self.strategy_orchestrator.orchestrate_matching_strategy(
-                company_name, tickers_df
-            )
+        if not company_names:
+            return []
+
+        tickers_df = self._get_ticker_data(use_cache)
 
-            # Calculate total latency
-            api_latency = time.time() - start_time
-
-            # Create and format result
-            match_result = MatchResult(
-                matched_name=result[0],
-                predicted_ticker=result[1],
-                all_possible_tickers=result[2],
-                name_match_score=result[3],
-                message=result[4],
-                top_matches=result[5],
-                api_latency=api_latency,
+        # Invalid names keep their own slot so each gets its own error response
+        slots: List[Any] = []
+        unique_names: Dict[Any, str] = {}
+        for position, name in enumerate(company_names):
+            if isinstance(name, str) and name.strip():
+                slot = self._match_key(name)
+            else:
+                slot = position
+            slots.append(slot)
+            unique_names.setdefault(slot, name)
+
+        responses = dict(
+            zip(
+                unique_names,
+                self._match_unique(list(unique_names.values()), tickers_df),
             )
+        )
+        return [self._copy_response(responses[slot]) for slot in slots]
 
-            # Convert to dictionary and add success flag
-            result_dict = asdict(match_result)
-            result_dict["success"] = True
+    def _match_unique(
+        self, company_names: List[str], tickers_df: pd.DataFrame
+    ) -> List[Dict[str, Any]]:
+        """
+        Match deduplicated company names, batching the OpenAI fallback.
 
-            self.logger.info(
-                "Successfully matched '%s' to '%s' in %.3fs",
-                company_name, result[1], api_latency
+        Args:
+            company_names: Company names with distinct match keys
+            tickers_df: Preprocessed ticker data
+
+        Returns:
+            List of match result dictionaries, in input order
+        """
+        max_workers = min(settings.BATCH_MATCH_MAX_WORKERS, len(company_names))
+        # The pool already spreads names over threads; don't nest cdist workers
+        with ThreadPoolExecutor(
+            max_workers=max_workers, initializer=use_single_worker
+        ) as executor:
+            first_pass = list(
+                executor.map(
+                    lambda name: self._match_without_fallback(name, tickers_df),
+                    company_names,
+                )
+            )
+
+        responses: List[Optional[Dict[str, Any]]] = [
+            response for response, _ in first_pass
+        ]
+        pending = [
+            (index, fallback)
+            for index, (_, fallback) in enumerate(first_pass)
+            if fallback is not None
+        ]
+        if pending:
+            orchestrator = self.strategy_orchestrator
+            fallback_results = orchestrator.orchestrate_openai_fallback_many(
+                [
+                    (company_name, candidates)
+                    for _, (company_name, _, candidates, _) in pending
+                ]
             )
-            return result_dict
+            for (index, (company_name, cache_key, _, start_ns)), result in zip(
+                pending, fallback_results
+            ):
+                self._store_cached_match(cache_key, tickers_df, result)
+                responses[index] = self._build_response(company_name, result, start_ns)
+
+        # Every slot got either a first-pass response or a fallback response
+        results: List[Dict[str, Any]] = []
+        for response in responses:
+            assert response is not None
+            results.append(response)
+        return results
+
+    def _match_with_df(
+        self,
+        company_name: str,
+        tickers_df: Optional[pd.DataFrame],
+        use_cache: bool = True,
+    ) -> Dict[str, Any]:
+        """
+        Match a company name against preloaded ticker data.
+
+        Args:
+            company_name: The company name to match
+            tickers_df: Preprocessed ticker data, or None to load it
+            use_cache: Whether to use cached ticker data when loading
+
+        Returns:
+            Dictionary with match results (see match)
+        """
+        start_ns = time.perf_counter_ns()
+        try:
+            # Load ticker data (already preprocessed for matching)
+            if tickers_df is None and isinstance(company_name, str):
+                tickers_df = self._get_ticker_data(use_cache)
+
+            error = self._validate_input(company_name, tickers_df, start_ns)
+            if error is not None:
+                return error
+            company_name = company_name.strip()
+
+            # Perform matching using orchestrated strategy, reusing cached results
+            cache_key = self._match_key(company_name)
+            result = self._get_cached_match(cache_key, tickers_df)
+            if result is None:
+                result = self.strategy_orchestrator.orchestrate_matching_strategy(
+                    company_name, tickers_df
+                )
+                self._store_cached_match(cache_key, tickers_df, result)
+
+            return self._build_response(company_name, result, start_ns)
 
         except (ValueError, KeyError, AttributeError, RuntimeError) as e:
             self.logger.error("Error matching company '%s': %s", company_name, str(e))
-            return self._error_response(f"Internal error: {str(e)}", start_time)
+            return self._error_response(f"Internal error: {str(e)}", start_ns)
 
-    def batch_match(
-        self, company_names: List[str], use_cache: bool = True
-    ) -> List[Dict[str, Any]]:
+    def _match_without_fallback(
+        self, company_name: str, tickers_df: pd.DataFrame
+    ) -> Tuple[Optional[Dict[str, Any]], Optional[Tuple]]:
         """
-        Match multiple company names in batch.
+        Match a company name without calling OpenAI.
 
         Args:
-            company_names: List of company names to match
-            use_cache: Whether to use cached ticker data
+            company_name: The company name to match
+            tickers_df: Preprocessed ticker data
 
         Returns:
-            List of match result dictionaries
+            Tuple of (response, pending fallback). Exactly one is set; the
+            pending fallback is (company_name, cache_key, candidates,
+            start_ns) for names that still need the OpenAI fallback.
         """
-        if not isinstance(company_names, list):
-            raise ValueError("company_names must be a list")
+        start_ns = time.perf_counter_ns()
+        try:
+            error = self._validate_input(company_name, tickers_df, start_ns)
+            if error is not None:
+                return error, None
+            company_name = company_name.strip()
 
-        results = []
-        for company_name in company_names:
-            result = self.match(company_name, use_cache)
-            results.append(result)
+            cache_key = self._match_key(company_name)
+            result = self._get_cached_match(cache_key, tickers_df)
+            if result is None:
+                result, candidates = self.strategy_orchestrator.match_without_fallback(
+                    company_name, tickers_df
+                )
+                if result is None:
+                    return None, (company_name, cache_key, candidates, start_ns)
+                self._store_cached_match(cache_key, tickers_df, result)
 
-        return results
+            return self._build_response(company_name, result, start_ns), None
+
+        except (ValueError, KeyError, AttributeError, RuntimeError) as e:
+            self.logger.error("Error matching company '%s': %s", company_name, str(e))
+            return self._error_response(f"Internal error: {str(e)}", start_ns), None
+
+    def _validate_input(
+        self,
+        company_name: str,
+        tickers_df: Optional[pd.DataFrame],
+        start_ns: int,
+    ) -> Optional[Dict[str, Any]]:
+        """
+        Validate a company name and the ticker data it will be matched against.
+
+        Args:
+            company_name: The company name to match
+            tickers_df: Preprocessed ticker data
+            start_ns: perf_counter_ns() value at the start of the request
+
+        Returns:
+            Error response dictionary, or None if the input is valid
+        """
+        if not company_name or not isinstance(company_name, str):
+            return self._error_response("Invalid company name provided", start_ns)
+
+        if not company_name.strip():
+            return self._error_response("Empty company name provided", start_ns)
+
+        if tickers_df is None or tickers_df.empty:
+            return self._error_response("No ticker data available", start_ns)
+
+        return None
+
+    def _build_response(
+        self, company_name: str, result: Tuple, start_ns: int
+    ) -> Dict[str, Any]:
+        """
+        Build the response dictionary for an orchestrator result.
+
+        Args:
+            company_name: The matched company name input
+            result: Orchestrator result tuple
+            start_ns: perf_counter_ns() value at the start of the request
+
+        Returns:
+            Dictionary with match results (see match)
+        """
+        # Calculate total latency
+        api_latency = (time.perf_counter_ns() - start_ns) / 1e9
+
+        # Create and format result
+        match_result = MatchResult(
+            matched_name=result[0],
+            predicted_ticker=result[1],
+            all_possible_tickers=result[2],
+            name_match_score=result[3],
+            message=result[4],
+            top_matches=result[5],
+            api_latency=api_latency,
+        )
+
+        # Convert to dictionary and add success flag
+        result_dict = self._copy_response(
+            {
+                "matched_name": match_result.matched_name,
+                "predicted_ticker": match_result.predicted_ticker,
+                "all_possible_tickers": match_result.all_possible_tickers,
+                "name_match_score": match_result.name_match_score,
+                "message": match_result.message,
+                "top_matches": match_result.top_matches,
+                "api_latency": match_result.api_latency,
+                "success": True,
+            }
+        )
+
+        if self._info_enabled:
+            self.logger.info(
+                "Successfully matched '%s' to '%s' in %.3fs",
+                company_name, result[1], api_latency
+            )
+        return result_dict
+
+    @staticmethod
+    def _copy_response(response: Dict[str, Any]) -> Dict[str, Any]:
+        """
+        Copy a response so callers can't change cached or shared results.
+
+        The ticker list and the flat top-match dicts are copied, which is
+        all a response holds by reference (cheaper than a deepcopy).
+
+        Args:
+            response: Match or error response dictionary
+
+        Returns:
+            Copy of the response
+        """
+        response = dict(response)
+        response["all_possible_tickers"] = list(response["all_possible_tickers"])
+        response["top_matches"] = [dict(match) for match in response["top_matches"]]
+        return response
 
     def health_check(self) -> Dict[str, Any]:
         """
@@ -186,7 +423,7 @@ class TickerMatcher:
         Returns:
             Dictionary with health status
         """
-        start_time = time.time()
+        start_ns = time.perf_counter_ns()
         health_status = {
             "status": "healthy",
             "checks": {},
@@ -229,13 +466,25 @@ class TickerMatcher:
             health_status["status"] = "unhealthy"
             health_status["error"] = str(e)
 
-        health_status["response_time"] = time.time() - start_time
+        health_status["response_time"] = (time.perf_counter_ns() - start_ns) / 1e9
         return health_status
 
-    def clear_cache(self) -> None:
-        """Clear the ticker data cache."""
-        self._ticker_data_cache = None
-        self._cache_timestamp = None
+    def clear_cache(self, clear_all: bool = False) -> None:
+        """
+        Clear the ticker data cache and the match result cache.
+
+        Args:
+            clear_all: Also drop ticker data cached for other database URLs
+        """
+        with self._shared_cache_lock:
+            if clear_all:
+                self._shared_cache.clear()
+            else:
+                self._shared_cache.pop(self.database_url, None)
+        self._remove_disk_cache()
+        with self._match_cache_lock:
+            self._match_cache.clear()
+            self._match_cache_source = None
         self.logger.info("Ticker data cache cleared")
 
     def get_stats(self) -> Dict[str, Any]:
@@ -245,12 +494,15 @@ class TickerMatcher:
         Returns:
             Dictionary with current stats and config
         """
+        with self._shared_cache_lock:
+            cached = self._shared_cache.get(self.database_url)
+
         return {
-            "cache_enabled": self._ticker_data_cache is not None,
-            "cache_age_seconds": (
-                time.time() - self._cache_timestamp if self._cache_timestamp else None
-            ),
+            "cache_enabled": cached is not None,
+            "cache_age_seconds": time.time() - cached[1] if cached else None,
             "cache_ttl_seconds": self._cache_ttl,
+            "match_cache_entries": len(self._match_cache),
+            "match_cache_size": self._match_cache_size,
             "openai_configured": bool(self.api_key),
             "database_configured": bool(self.database_url),
             "services_initialized": {
@@ -301,7 +553,7 @@ class TickerMatcher:
 
     def _get_ticker_data(self, use_cache: bool = True) -> pd.DataFrame:
         """
-        Get ticker data with optional caching.
+        Get ticker data, with the preprocessed_title column, with optional caching.
 
         Args:
             use_cache: Whether to use cached data
@@ -310,22 +562,26 @@ class TickerMatcher:
             DataFrame with ticker data
         """
         # Check cache validity
-        if (
-            use_cache
-            and self._ticker_data_cache is not None
-            and self._cache_timestamp is not None
-            and time.time() - self._cache_timestamp < self._cache_ttl
-        ):
-            return self._ticker_data_cache
-
-        # Load fresh data
+        if use_cache:
+            cached = self._get_shared_ticker_data()
+            if cached is not None:
+                return cached
+
+        # Try the on-disk copy before going to the database
+        tickers_df = self._read_disk_cache() if use_cache else None
+        if tickers_df is not None:
+            return self._store_shared_ticker_data(self._to_arrow_strings(tickers_df))
+
+        # Load fresh data. TickerMatcher keeps its own TTL cache, so the
+        # loader's cache is always bypassed; stacking both could serve data
+        # up to two TTLs old.
         if self.dataframe_loader:
-            tickers_df = self.dataframe_loader.load_tickers_dataframe()
+            tickers_df = self.dataframe_loader.load_tickers_dataframe(use_cache=False)
         else:
             # Fallback: try to create temporary loader from settings
             try:
                 temp_loader = TickerDataFrameLoaderService(settings.DATABASE_URL)
-                tickers_df = temp_loader.load_tickers_dataframe()
+                tickers_df = temp_loader.load_tickers_dataframe(use_cache=False)
             except (ValueError, KeyError, AttributeError, RuntimeError,
                     ConnectionError, ImportError, ModuleNotFoundError):
                 self.logger.error(
@@ -333,20 +589,231 @@ class TickerMatcher:
                 )
                 return pd.DataFrame()
 
+        # Preprocess once per load so cached data is ready for matching
+        if not tickers_df.empty and "preprocessed_title" not in tickers_df.columns:
+            tickers_df = self.data_preparer.add_preprocessed_column(tickers_df)
+        tickers_df = self._to_arrow_strings(tickers_df)
+
         # Update cache
         if use_cache:
-            self._ticker_data_cache = tickers_df
-            self._cache_timestamp = time.time()
+            stored = self._store_shared_ticker_data(tickers_df)
+            if stored is tickers_df:
+                self._write_disk_cache(tickers_df)
+            return stored
+
+        return tickers_df
+
+    def _get_shared_ticker_data(self) -> Optional[pd.DataFrame]:
+        """
+        Get this database's ticker data from the shared cache if still fresh.
+
+        Returns:
+            Cached DataFrame, or None on a miss
+        """
+        with self._shared_cache_lock:
+            cached = self._shared_cache.get(self.database_url)
+            if cached is not None and time.time() - cached[1] < self._cache_ttl:
+                return cached[0]
+        return None
+
+    def _store_shared_ticker_data(self, tickers_df: pd.DataFrame) -> pd.DataFrame:
+        """
+        Store freshly loaded ticker data in the shared cache.
+
+        The load itself runs without the lock, so another instance may have
+        stored fresh data in the meantime; that copy wins so every instance
+        keeps matching against the same DataFrame.
+
+        Args:
+            tickers_df: Freshly loaded ticker data
+
+        Returns:
+            The DataFrame now held in the shared cache
+        """
+        with self._shared_cache_lock:
+            cached = self._get_shared_ticker_data()
+            if cached is not None:
+                return cached
+            self._shared_cache[self.database_url] = (tickers_df, time.time())
+            return tickers_df
+
+    @staticmethod
+    def _to_arrow_strings(tickers_df: pd.DataFrame) -> pd.DataFrame:
+        """
+        Store the string columns of the ticker data as Arrow-backed strings.
+
+        This cuts the per-value object overhead of the cached frame and keeps
+        the .str operations used for matching in Arrow's compute kernels.
+
+        Args:
+            tickers_df: Ticker data
+
+        Returns:
+            Ticker data with Arrow-backed string columns
+        """
+        dtypes = {
+            column: "string[pyarrow]"
+            for column in ARROW_STRING_COLUMNS
+            if column in tickers_df.columns
+        }
+        if not dtypes:
+            return tickers_df
+        return tickers_df.astype(dtypes)
+
+    def _disk_cache_path(self) -> Optional[str]:
+        """
+        Get the Feather cache file path for the current database.
+
+        Freshness is decided by the file's mtime, so the name is stable and
+        each refresh overwrites the previous file.
+
+        Returns:
+            Cache file path, or None if disk caching is disabled
+        """
+        if not self._cache_dir:
+            return None
+
+        # Hash the URL so credentials never end up in file names
+        url_hash = hashlib.sha256(self.database_url.encode("utf-8")).hexdigest()[:16]
+        return os.path.join(self._cache_dir, f"tickers_{url_hash}.feather")
+
+    def _read_disk_cache(self) -> Optional[pd.DataFrame]:
+        """
+        Read ticker data from the disk cache if it is fresher than the TTL.
 
+        Returns:
+            Cached DataFrame, or None on a miss
+        """
+        cache_path = self._disk_cache_path()
+        if cache_path is None:
+            return None
+
+        try:
+            if time.time() - os.path.getmtime(cache_path) >= self._cache_ttl:
+                return None
+            tickers_df = pd.read_feather(cache_path)
+        except FileNotFoundError:
+            return None
+        except (OSError, ValueError, ImportError) as e:
+            self.logger.warning("Ignoring unreadable ticker disk cache: %s", e)
+            return None
+
+        self.logger.info("Loaded %d tickers from disk cache", len(tickers_df))
         return tickers_df
 
-    def _error_response(self, message: str, start_time: float) -> Dict[str, Any]:
+    def _write_disk_cache(self, tickers_df: pd.DataFrame) -> None:
+        """
+        Write ticker data to the disk cache.
+
+        The file is written next to its final path and renamed into place so
+        concurrent readers never see a partial file.
+
+        Args:
+            tickers_df: Preprocessed ticker data
+        """
+        cache_path = self._disk_cache_path()
+        if cache_path is None or tickers_df.empty:
+            return
+
+        tmp_path = f"{cache_path}.{os.getpid()}.{threading.get_ident()}.tmp"
+        try:
+            os.makedirs(os.path.dirname(cache_path), exist_ok=True)
+            tickers_df.reset_index(drop=True).to_feather(
+                tmp_path, compression="zstd"
+            )
+            os.replace(tmp_path, cache_path)
+        except (OSError, ValueError, ImportError) as e:
+            self.logger.warning("Could not write ticker disk cache: %s", e)
+            if os.path.exists(tmp_path):
+                os.remove(tmp_path)
+
+    def _remove_disk_cache(self) -> None:
+        """Remove the disk cache file for the current database."""
+        cache_path = self._disk_cache_path()
+        if cache_path is None:
+            return
+
+        try:
+            os.remove(cache_path)
+        except FileNotFoundError:
+            pass
+
+    @staticmethod
+    def _match_key(company_name: str) -> str:
+        """
+        Get the match cache key for a company name.
+
+        Exact matching compares the lowercased name, so names that only
+        share a preprocessed form (e.g. "Apple" and "Apple Inc") get
+        separate entries.
+
+        Args:
+            company_name: Company name to match
+
+        Returns:
+            Stripped, lowercased company name
+        """
+        return company_name.strip().lower()
+
+    def _get_cached_match(
+        self, cache_key: str, tickers_df: pd.DataFrame
+    ) -> Optional[Tuple]:
+        """
+        Look up a cached match result for the given ticker data.
+
+        Args:
+            cache_key: Match cache key (see _match_key)
+            tickers_df: Ticker DataFrame the result must have been computed on
+
+        Returns:
+            Cached orchestrator result tuple, or None on a miss
+        """
+        with self._match_cache_lock:
+            if self._match_cache_source is not tickers_df:
+                return None
+
+            result = self._match_cache.get(cache_key)
+            if result is not None:
+                self._match_cache.move_to_end(cache_key)
+            return result
+
+    def _store_cached_match(
+        self, cache_key: str, tickers_df: pd.DataFrame, result: Tuple
+    ) -> None:
+        """
+        Store a match result, evicting the least recently used entries.
+
+        Args:
+            cache_key: Match cache key (see _match_key)
+            tickers_df: Ticker DataFrame the result was computed on
+            result: Orchestrator result tuple
+        """
+        if self._match_cache_size <= 0:
+            return
+
+        # Only cache definitive results so transient OpenAI failures are retried
+        ticker, message = result[0], result[4]
+        if ticker is None and message != NO_MATCH_MESSAGE:
+            return
+
+        with self._match_cache_lock:
+            # Results from older ticker data are stale once new data is loaded
+            if self._match_cache_source is not tickers_df:
+                self._match_cache.clear()
+                self._match_cache_source = tickers_df
+
+            self._match_cache[cache_key] = result
+            self._match_cache.move_to_end(cache_key)
+            while len(self._match_cache) > self._match_cache_size:
+                self._match_cache.popitem(last=False)
+
+    def _error_response(self, message: str, start_ns: int) -> Dict[str, Any]:
         """
         Create standardized error response.
 
         Args:
             message: Error message
-            start_time: Request start time
+            start_ns: perf_counter_ns() value at the start of the request
 
         Returns:
             Error response dictionary
@@ -358,7 +825,7 @@ class TickerMatcher:
             "name_match_score": 0.0,
             "message": message,
             "top_matches": [],
-            "api_latency": time.time() - start_time,
+            "api_latency": (time.perf_counter_ns() - start_ns) / 1e9,
             "success": False,
         }
 
@@ -6,7 +6,7 @@ from datetime import datetime
 import pandas as pd
 
 
-@dataclass
+@dataclass(slots=True)
 class TickerData:
     """Model for ticker data."""
 
@@ -25,11 +25,12 @@ class TickerData:
             List of TickerData objects
         """
         return [
-            cls(ticker=row["ticker"], title=row["title"]) for _, row in df.iterrows()
+            cls(ticker=ticker, title=title)
+            for ticker, title in zip(df["ticker"].to_numpy(), df["title"].to_numpy())
         ]
 
 
-@dataclass
+@dataclass(slots=True)
 class MatchResult:
     """Model for company name matching results."""
 
@@ -42,7 +43,7 @@ class MatchResult:
     api_latency: float
 
 
-@dataclass
+@dataclass(slots=True)
 class TopMatch:
     """Model for top match candidates."""
 
@@ -52,7 +53,7 @@ class TopMatch:
     name_match_score: float
 
 
-@dataclass
+@dataclass(slots=True)
 class UpdateMetadata:
     """Model for update metadata."""
 
@@ -1,11 +1,12 @@
 """Utilities package for helper functions."""
 
-from .company_name_cleaner import preprocess_company_name
+from .company_name_cleaner import preprocess_company_name, preprocess_company_names
 from .etf_detector import filter_etfs
 from .text_extractor import extract_company_and_ticker
 
 __all__ = [
     "preprocess_company_name",
+    "preprocess_company_names",
     "filter_etfs",
     "extract_company_and_ticker",
 ]
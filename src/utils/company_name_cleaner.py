@@ -2,11 +2,15 @@
 
 from typing import Optional
 
+import pandas as pd
+
 from src.utils.text_processing import (
     TextCaseConverterService,
     AlphanumericCleanerService,
     SuffixRemoverService,
     WhitespaceNormalizerService,
+    clean,
+    clean_series,
 )
 
 
@@ -114,11 +118,25 @@ def preprocess_company_name(name: str) -> str:
     if not isinstance(name, str):
         return name
 
-    # Property-style chaining approach using micro-services
-    processor = CompanyNameProcessor(name)
-    return (
-        processor.lowercased.alphanumeric_only.without_suffixes.normalized_whitespace.value
-    )
+    # Same steps as the CompanyNameProcessor chain, without building a
+    # processor object per step on this hot path
+    return clean(name)
+
+
+def preprocess_company_names(names: pd.Series) -> pd.Series:
+    """
+    Preprocess a whole column of company names with vectorized string ops.
+
+    Produces the same values as applying preprocess_company_name to each
+    string element; missing values stay missing.
+
+    Args:
+        names: Series of company names
+
+    Returns:
+        Series of preprocessed company names
+    """
+    return clean_series(names)
 
 
 def remove_suffix(text: str, suffix: str) -> str:
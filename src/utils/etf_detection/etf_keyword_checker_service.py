@@ -1,9 +1,13 @@
 """Service responsible only for ETF keyword checking."""
 
 import re
+from typing import List
 import pandas as pd
 from src.config.settings import settings
 
+_ETF_KEYWORDS = tuple(keyword.lower() for keyword in settings.ETF_KEYWORDS)
+_ETF_RE = re.compile("|".join(map(re.escape, _ETF_KEYWORDS)), re.IGNORECASE)
+
 
 class ETFKeywordCheckerService:
     """Service responsible only for ETF keyword checking."""
@@ -13,14 +17,26 @@ class ETFKeywordCheckerService:
         Check if company name contains ETF keywords.
 
         Args:
-            company_name: Company name to check
+            company_name: Company name to check (non-strings such as NaN never match)
 
         Returns:
             True if ETF keywords are found, False otherwise
         """
-        if not company_name or pd.isna(company_name):
+        if not company_name or not isinstance(company_name, str):
             return False
 
-        name = str(company_name)
-        etf_pattern = "|".join(settings.ETF_KEYWORDS)
-        return bool(re.search(etf_pattern, name.lower(), re.IGNORECASE))
+        lowered = company_name.lower()
+        return any(keyword in lowered for keyword in _ETF_KEYWORDS)
+
+    def check_etf_keywords_bulk(self, company_names: List[str]) -> List[bool]:
+        """
+        Check many company names for ETF keywords in one vectorized pass.
+
+        Args:
+            company_names: Company names to check (may contain NaN values)
+
+        Returns:
+            List of booleans, True where ETF keywords are found
+        """
+        names = pd.Series(company_names, dtype="string")
+        return names.str.contains(_ETF_RE, regex=True, na=False).tolist()
@@ -1,7 +1,7 @@
 """Service responsible only for fund type classification."""
 
-import re
-import pandas as pd
+_FUND_KEYWORDS = ("fund", "etf", "trust", "index")
+_LEVERAGED_KEYWORDS = ("2x", "3x", "ultra", "leveraged", "bull", "bear")
 
 
 class FundTypeClassifierService:
@@ -17,13 +17,11 @@ class FundTypeClassifierService:
         Returns:
             True if it's classified as a fund, False otherwise
         """
-        if not company_name or pd.isna(company_name):
+        if not company_name or not isinstance(company_name, str):
             return False
 
-        name = str(company_name)
-        fund_keywords = ["fund", "etf", "trust", "index"]
-        pattern = "|".join(fund_keywords)
-        return bool(re.search(pattern, name.lower(), re.IGNORECASE))
+        lowered = company_name.lower()
+        return any(keyword in lowered for keyword in _FUND_KEYWORDS)
 
     def classify_as_leveraged(self, company_name: str) -> bool:
         """
@@ -35,10 +33,8 @@ class FundTypeClassifierService:
         Returns:
             True if it's classified as leveraged, False otherwise
         """
-        if not company_name or pd.isna(company_name):
+        if not company_name or not isinstance(company_name, str):
             return False
 
-        name = str(company_name)
-        leveraged_keywords = ["2x", "3x", "ultra", "leveraged", "bull", "bear"]
-        pattern = "|".join(leveraged_keywords)
-        return bool(re.search(pattern, name.lower(), re.IGNORECASE))
+        lowered = company_name.lower()
+        return any(keyword in lowered for keyword in _LEVERAGED_KEYWORDS)
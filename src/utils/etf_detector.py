@@ -67,7 +67,7 @@ def filter_etfs(company_names: List[str]) -> List[bool]:
     Returns:
         List of boolean values indicating whether each name is an ETF
     """
-    return [ETFDetector(name).is_etf for name in company_names]
+    return ETFKeywordCheckerService().check_etf_keywords_bulk(company_names)
 
 
 def detect_etf(company_name: str) -> bool:
@@ -1,8 +1,17 @@
 """Database export utility with proper dependency injection."""
 
 import logging
+from typing import Dict, Iterable, List, Optional, Sequence, Tuple
+
 import pandas as pd
-from sqlalchemy import create_engine
+import pyarrow as pa
+import pyarrow.ipc as pa_ipc
+import pyarrow.parquet as pq
+from sqlalchemy import Engine, create_engine
+
+from src.config.settings import settings
+
+EXPORT_FORMATS = ("csv", "feather", "parquet")
 
 # Configure logging
 logging.basicConfig(level=logging.INFO, format="%(asctime)s - %(levelname)s - %(message)s")
@@ -10,7 +19,7 @@ logger = logging.getLogger(__name__)
 
 
 class DatabaseExportService:
-    """Service for exporting database data to CSV files."""
+    """Service for exporting database data to CSV, Feather or Parquet files."""
 
     def __init__(self, database_url: str):
         """
@@ -23,47 +32,259 @@ class DatabaseExportService:
             raise ValueError("database_url is required")
 
         self.database_url = database_url
+        self._engine: Optional[Engine] = None
+
+    @property
+    def engine(self) -> Engine:
+        """Get the pooled engine, creating it on first use."""
+        if self._engine is None:
+            self._engine = create_engine(self.database_url, pool_pre_ping=True)
+        return self._engine
 
-    def export_to_csv(self, output_file: str = "tickers_export.csv") -> None:
+    def export_to_csv(
+        self, output_file: str = "tickers_export.csv", output_format: str = "csv"
+    ) -> None:
         """
-        Export ticker database to CSV file.
+        Export ticker database to a CSV, Feather or Parquet file.
 
         Args:
-            output_file: Name of the output CSV file
+            output_file: Name of the output file
+            output_format: One of "csv", "feather" or "parquet"
+
+        Raises:
+            ValueError: If output_format is not supported
         """
+        if output_format not in EXPORT_FORMATS:
+            raise ValueError(
+                f"output_format must be one of {', '.join(EXPORT_FORMATS)}"
+            )
+
         try:
-            # Create database connection
-            engine = create_engine(self.database_url)
+            # Reuse the pooled database connection
+            engine = self.engine
 
             # Query all tickers
             query = "SELECT * FROM tickers ORDER BY ticker"
-            df = pd.read_sql_query(query, engine)
 
-            # Export to CSV
-            df.to_csv(output_file, index=False)
+            # PostgreSQL can write the CSV itself, skipping Python rows
+            # entirely; copy_expert is specific to psycopg2 cursors
+            if output_format == "csv" and engine.dialect.driver == "psycopg2":
+                row_count = self._copy_to_csv(engine, query, output_file)
+                logger.info("Exported %d tickers to %s", row_count, output_file)
+                return
 
-            logger.info("Exported %d tickers to %s", len(df), output_file)
-            logger.info("Sample data:")
-            logger.info("\n%s", df.head().to_string())
+            # Export one batch of rows at a time so memory stays bounded.
+            # stream_results uses a server-side cursor, so the driver doesn't
+            # buffer the whole result client-side before the first batch
+            # arrives.
+            with engine.connect().execution_options(
+                stream_results=True, yield_per=settings.DB_FETCH_BATCH_SIZE
+            ) as connection:
+                result = connection.exec_driver_sql(query)
+                if output_format == "csv":
+                    row_count, sample = self._write_csv_partitions(
+                        list(result.keys()), result.partitions(), output_file
+                    )
+                else:
+                    row_count, sample = self._write_partitions(
+                        list(result.keys()),
+                        result.partitions(),
+                        output_format,
+                        output_file,
+                    )
 
-        except (ValueError, ConnectionError, RuntimeError) as e:
+            logger.info("Exported %d tickers to %s", row_count, output_file)
+            if sample:
+                logger.info("Sample data:")
+                logger.info("\n%s", "\n".join(map(str, sample)))
+
+        except (ValueError, ConnectionError, RuntimeError, pa.ArrowException) as e:
             logger.error("Error exporting database: %s", e)
 
+    def _write_csv_partitions(
+        self,
+        columns: List[str],
+        partitions: Iterable[Sequence[Sequence]],
+        output_file: str,
+    ) -> Tuple[int, List[Dict]]:
+        """
+        Append batches of result rows to a CSV file.
+
+        pandas writes the CSV, since Arrow's CSV writer quotes every string.
+        Columns are kept as object dtype so each value is written from its
+        database type, the same way in every batch. Unlike a single
+        read_sql_query/to_csv, integer columns containing NULLs are written
+        as integers ("0") rather than floats ("0.0").
+
+        Args:
+            columns: Result column names
+            partitions: Batches of result rows
+            output_file: Name of the output CSV file
+
+        Returns:
+            Tuple of (rows written, first rows of the export for logging)
+        """
+        row_count = 0
+        sample: List[Dict] = []
+        with open(output_file, "w", newline="") as f:
+            # Header first, so an empty result still gets one
+            pd.DataFrame(columns=columns).to_csv(f, index=False)
+            for rows in partitions:
+                df = pd.DataFrame(list(rows), columns=columns, dtype=object)
+                if not sample:
+                    sample = df.head().to_dict("records")
+                df.to_csv(f, header=False, index=False)
+                row_count += len(df)
+
+        return row_count, sample
+
+    def _write_partitions(
+        self,
+        columns: List[str],
+        partitions: Iterable[Sequence[Sequence]],
+        output_format: str,
+        output_file: str,
+    ) -> Tuple[int, List[Dict]]:
+        """
+        Write batches of result rows to a single Feather or Parquet file.
+
+        Args:
+            columns: Result column names
+            partitions: Batches of result rows
+            output_format: Either "feather" or "parquet"
+            output_file: Name of the output file
+
+        Returns:
+            Tuple of (rows written, first rows of the export for logging)
+        """
+        row_count = 0
+        sample: List[Dict] = []
+        schema: Optional[pa.Schema] = None
+        pending: List[pa.Table] = []
+        writer = None
+        try:
+            for rows in partitions:
+                table = pa.Table.from_pydict(
+                    dict(zip(columns, (list(values) for values in zip(*rows))))
+                )
+                row_count += len(rows)
+                if writer is not None:
+                    writer.write_table(self._conform(table, schema))
+                    continue
+
+                # Columns that are all NULL so far infer as the null type, so
+                # hold batches back until every column has shown a value
+                pending.append(table)
+                schema = (
+                    pa.unify_schemas([schema, table.schema], promote_options="default")
+                    if schema is not None
+                    else table.schema
+                )
+                if any(pa.types.is_null(field.type) for field in schema):
+                    continue
+
+                writer = self._open_writer(output_format, output_file, schema)
+                sample = pending[0].slice(0, 5).to_pylist()
+                for buffered in pending:
+                    writer.write_table(self._conform(buffered, schema))
+                pending = []
+
+            # Columns with no values at all keep the null type; an empty
+            # result still gets its schema written
+            if writer is None:
+                if schema is None:
+                    schema = pa.schema([(column, pa.null()) for column in columns])
+                writer = self._open_writer(output_format, output_file, schema)
+                if pending:
+                    sample = pending[0].slice(0, 5).to_pylist()
+                for buffered in pending or [schema.empty_table()]:
+                    writer.write_table(self._conform(buffered, schema))
+        finally:
+            if writer is not None:
+                writer.close()
+
+        return row_count, sample
+
+    @staticmethod
+    def _conform(table: pa.Table, schema: pa.Schema) -> pa.Table:
+        """
+        Cast a batch whose inferred types differ from the writer schema.
+
+        Batches usually differ only in columns that are all NULL there. A
+        batch that cannot be cast safely raises an Arrow error rather than
+        being coerced.
+
+        Args:
+            table: Batch of result rows
+            schema: Schema of the output file
+
+        Returns:
+            Table with the writer schema
+        """
+        return table if table.schema == schema else table.cast(schema)
+
+    @staticmethod
+    def _open_writer(output_format: str, output_file: str, schema: pa.Schema):
+        """
+        Open an Arrow writer for the requested export format.
+
+        Args:
+            output_format: Either "feather" or "parquet"
+            output_file: Name of the output file
+            schema: Arrow schema of the exported table
+
+        Returns:
+            Writer with write_table and close methods
+        """
+        if output_format == "feather":
+            # Feather V2 is the Arrow IPC file format
+            return pa_ipc.new_file(
+                output_file,
+                schema,
+                options=pa_ipc.IpcWriteOptions(compression="zstd"),
+            )
+        return pq.ParquetWriter(output_file, schema, compression="zstd")
+
+    def _copy_to_csv(self, engine: Engine, query: str, output_file: str) -> int:
+        """
+        Stream a query result to a CSV file with PostgreSQL COPY TO STDOUT.
+
+        Args:
+            engine: SQLAlchemy engine using the psycopg2 driver
+            query: SELECT statement to export
+            output_file: Name of the output CSV file
+
+        Returns:
+            Number of rows written
+        """
+        connection = engine.raw_connection()
+        try:
+            with connection.cursor() as cursor, open(output_file, "wb") as f:
+                cursor.copy_expert(f"COPY ({query}) TO STDOUT WITH CSV HEADER", f)
+                return cursor.rowcount
+        finally:
+            connection.close()
+
 
-def export_database_to_csv(database_url: str, output_file: str = "tickers_export.csv") -> None:
+def export_database_to_csv(
+    database_url: str,
+    output_file: str = "tickers_export.csv",
+    output_format: str = "csv",
+) -> None:
     """
     Export database to CSV with dependency injection.
 
     Args:
         database_url: PostgreSQL database connection URL (must be provided)
-        output_file: Name of the output CSV file
+        output_file: Name of the output file
+        output_format: One of "csv", "feather" or "parquet"
     """
     if not database_url:
         logger.error("database_url parameter is required")
         return
 
     export_service = DatabaseExportService(database_url)
-    export_service.export_to_csv(output_file)
+    export_service.export_to_csv(output_file, output_format)
 
 
 # Note: No main() function with os.environ usage
@@ -1,10 +1,27 @@
 """Text extraction utility function."""
 
+import functools
 
+# Common prefixes that might be added by AI responses
+_PREFIXES: tuple[str, ...] = (
+    "Legal Company Name: ",
+    "Best match: ",
+    "Company: ",
+    "Match: ",
+)
+
+# Separator before the ticker in "Company Name (Ticker: SYMBOL)"
+_TICKER_SEPARATOR = " (Ticker:"
+
+
+@functools.lru_cache(maxsize=8192)
 def extract_company_and_ticker(text: str) -> tuple[str, str]:
     """
     Extract company name and ticker from formatted text.
 
+    Results are memoized, since AI answers and candidate names repeat
+    heavily; use extract_company_and_ticker.cache_clear() to reset.
+
     Args:
         text: Text containing company name and optionally ticker
 
@@ -14,24 +31,17 @@ def extract_company_and_ticker(text: str) -> tuple[str, str]:
     text = text.strip()
 
     # Remove common prefixes that might be added by AI responses
-    prefixes_to_remove = [
-        "Legal Company Name: ",
-        "Best match: ",
-        "Company: ",
-        "Match: ",
-    ]
-
-    for prefix in prefixes_to_remove:
-        if text.startswith(prefix):
-            text = text[len(prefix) :].strip()
+    for prefix in _PREFIXES:
+        stripped = text.removeprefix(prefix)
+        if len(stripped) != len(text):
+            text = stripped.strip()
             break
 
     # Extract company name and ticker if in format "Company Name (Ticker: SYMBOL)"
-    if " (Ticker:" in text and text.endswith(")"):
-        parts = text.split(" (Ticker:")
-        company_name = parts[0].strip()
-        ticker = parts[1].replace(")", "").strip()
-        return company_name, ticker
+    company_name, separator, rest = text.partition(_TICKER_SEPARATOR)
+    if separator and text.endswith(")"):
+        ticker = rest.partition(_TICKER_SEPARATOR)[0].replace(")", "").strip()
+        return company_name.strip(), ticker
 
     # No ticker format, just company name
-    return text.strip(), None
+    return text, None
@@ -4,10 +4,13 @@ from .text_case_converter_service import TextCaseConverterService
 from .alphanumeric_cleaner_service import AlphanumericCleanerService
 from .suffix_remover_service import SuffixRemoverService
 from .whitespace_normalizer_service import WhitespaceNormalizerService
+from .fast_clean import clean, clean_series
 
 __all__ = [
     "TextCaseConverterService",
     "AlphanumericCleanerService",
     "SuffixRemoverService",
     "WhitespaceNormalizerService",
+    "clean",
+    "clean_series",
 ]
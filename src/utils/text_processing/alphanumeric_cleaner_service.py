@@ -1,6 +1,10 @@
 """Service responsible only for alphanumeric cleaning."""
 
-import re
+import string
+
+# Every byte except lowercase letters, digits and space
+_KEEP_BYTES = (string.ascii_lowercase + string.digits + " ").encode("ascii")
+_DELETE_BYTES = bytes(b for b in range(256) if b not in _KEEP_BYTES)
 
 
 class AlphanumericCleanerService:
@@ -16,4 +20,8 @@ class AlphanumericCleanerService:
         Returns:
             Cleaned text with only alphanumeric characters and spaces
         """
-        return re.sub(r"[^a-z0-9 ]", "", text)
+        # Non-ASCII characters are never kept, so dropping them while encoding
+        # leaves a single C-level bytes deletion pass
+        return (
+            text.encode("ascii", "ignore").translate(None, _DELETE_BYTES).decode("ascii")
+        )
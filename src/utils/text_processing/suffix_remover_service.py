@@ -1,22 +1,53 @@
 """Service responsible only for suffix removal."""
 
+import re
+
 from src.config.settings import settings
 
+# Longest suffixes first so the alternation takes the longest match
+_SUFFIX_RE = re.compile(
+    "(?:"
+    + "|".join(
+        re.escape(suffix)
+        for suffix in sorted(settings.COMPANY_SUFFIXES, key=len, reverse=True)
+    )
+    + ")$"
+)
+
+# Suffixes grouped by length, longest first, so finding the suffix at the
+# end of a string costs one slice and set lookup per distinct length
+_SUFFIXES_BY_LENGTH = tuple(
+    (length, frozenset(s for s in settings.COMPANY_SUFFIXES if len(s) == length))
+    for length in sorted({len(s) for s in settings.COMPANY_SUFFIXES}, reverse=True)
+    if length
+)
+
 
 class SuffixRemoverService:
     """Service responsible only for suffix removal."""
 
+    @property
+    def suffix_pattern(self) -> str:
+        """Anchored suffix regex, usable with pandas .str.replace."""
+        return _SUFFIX_RE.pattern
+
     def remove_company_suffixes(self, text: str) -> str:
         """
         Remove common company suffixes from text.
 
+        Suffixes are stripped repeatedly, since removing one can expose
+        another (e.g. "acme holdings inc").
+
         Args:
             text: Text to process
 
         Returns:
             Text with company suffixes removed
         """
-        for suffix in settings.COMPANY_SUFFIXES:
-            if text.endswith(suffix):
-                text = text[: -len(suffix)]
-        return text
+        while True:
+            for length, suffixes in _SUFFIXES_BY_LENGTH:
+                if text[-length:] in suffixes:
+                    text = text[:-length]
+                    break
+            else:
+                return text
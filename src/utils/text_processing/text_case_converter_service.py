@@ -14,4 +14,8 @@ class TextCaseConverterService:
         Returns:
             Lowercase text
         """
-        return text.lower() if isinstance(text, str) else str(text).lower()
+        if isinstance(text, str):
+            # islower() stops at the first uppercase character and lets
+            # already-lowercase input skip allocating a copy
+            return text if text.islower() else text.lower()
+        return str(text).lower()
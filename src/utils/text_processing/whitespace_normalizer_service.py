@@ -2,6 +2,8 @@
 
 import re
 
+_WHITESPACE_RE = re.compile(r"\s+")
+
 
 class WhitespaceNormalizerService:
     """Service responsible only for whitespace normalization."""
@@ -16,4 +18,4 @@ class WhitespaceNormalizerService:
         Returns:
             Text with normalized whitespace
         """
-        return re.sub(r"\s+", " ", text).strip()
+        return _WHITESPACE_RE.sub(" ", text).strip()